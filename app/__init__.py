@@ -25,6 +25,7 @@ from flask_cors import CORS
 from werkzeug.exceptions import InternalServerError
 
 from app.models.db import db
+from app.json_provider import OrjsonProvider
 from app.logger import logger
 from app.routes import register_routes
 from app.models.resource import sync_resources
@@ -181,6 +182,7 @@ def create_app(config_class):
     env = os.getenv('FLASK_ENV')
     logger.info("Creating app in %s environment.", env)
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(config_class)
     if env in ('development', 'staging'):
         CORS(
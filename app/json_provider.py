@@ -0,0 +1,55 @@
+"""
+app.json_provider
+-----------------
+
+This module defines the orjson-backed JSON provider of the PM Guardian API.
+It replaces Flask's standard library JSON provider for request payload
+parsing and jsonify() responses.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider serializing and parsing with orjson.
+
+    Datetimes and dataclasses are passed through to Flask's default
+    handler so the output matches DefaultJSONProvider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as a JSON string.
+
+        Args:
+            obj: The data to serialize.
+            **kwargs: Ignored; orjson always produces compact output.
+
+        Returns:
+            str: The JSON document.
+        """
+        _ = kwargs
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data from a JSON string or bytes.
+
+        Args:
+            s (str | bytes): The JSON document.
+            **kwargs: Ignored.
+
+        Returns:
+            The deserialized data.
+        """
+        _ = kwargs
+        return orjson.loads(s)
@@ -58,10 +58,16 @@ class Permission(db.Model):
         primary_key=True,
         default=lambda: str(uuid.uuid4())
     )
+    # Stored as a short VARCHAR with a CHECK constraint rather than a
+    # native database ENUM, so the column is indexed as a plain string.
     operation = db.Column(
         db.Enum(
             OperationEnum,
-            values_callable=lambda x: [e.value for e in x]
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            name='ck_permission_operation'
         ),
         nullable=False
     )
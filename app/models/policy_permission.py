@@ -23,6 +23,9 @@ class PolicyPermission(db.Model):
     """
 
     __tablename__ = "policy_permissions"
+    __table_args__ = (
+        db.Index('ix_policy_permission_policy', 'policy_id', 'permission_id'),
+    )
     id = db.Column(db.String, primary_key=True)
     policy_id = db.Column(
         db.String, db.ForeignKey("policies.id"), nullable=False
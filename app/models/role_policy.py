@@ -23,6 +23,9 @@ class RolePolicy(db.Model):
     """
 
     __tablename__ = "role_policies"
+    __table_args__ = (
+        db.Index('ix_role_policy_role', 'role_id', 'policy_id'),
+    )
     id = db.Column(db.String, primary_key=True)
     role_id = db.Column(
         db.String, db.ForeignKey("roles.id"), nullable=False
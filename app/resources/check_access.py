@@ -14,6 +14,7 @@ from app.models import (
     UserRole, RolePolicy, PolicyPermission, Permission, OperationEnum,
     Resource
 )
+from app.models.db import db
 from app.logger import logger
 
 
@@ -51,8 +52,10 @@ class CheckAccessResource(ApiResource):
             }, 400
         try:
             # 1. Find the resource
-            resource = Resource.query.filter_by(name=resource_name).first()
-            if not resource:
+            resource_id = db.session.query(Resource.id).filter_by(
+                name=resource_name
+            ).scalar()
+            if resource_id is None:
                 return {
                     "access_granted": False,
                     "reason": (
@@ -70,44 +73,52 @@ class CheckAccessResource(ApiResource):
                     )
                 }, 400
             # 3. Get all user roles
-            user_roles = UserRole.query.filter_by(user_id=user_id).all()
-            if not user_roles:
+            role_ids = [
+                role_id for (role_id,) in UserRole.query.with_entities(
+                    UserRole.role_id
+                ).filter_by(user_id=user_id)
+            ]
+            if not role_ids:
                 return {
                     "access_granted": False,
                     "reason": "User has no roles assigned."
                 }, 403
-            role_ids = [ur.role_id for ur in user_roles]
             # 4. Get all policies for these roles
-            role_policies = RolePolicy.query.filter(
-                RolePolicy.role_id.in_(role_ids)
-            ).all()
-            if not role_policies:
+            policy_ids = [
+                policy_id for (policy_id,) in RolePolicy.query.with_entities(
+                    RolePolicy.policy_id
+                ).filter(RolePolicy.role_id.in_(role_ids))
+            ]
+            if not policy_ids:
                 return {
                     "access_granted": False,
                     "reason": (
                         "User's roles have no policies assigned."
                     )
                 }, 403
-            policy_ids = [rp.policy_id for rp in role_policies]
             # 5. Get all policy_permissions for these policies
-            policy_permissions = PolicyPermission.query.filter(
-                PolicyPermission.policy_id.in_(policy_ids)
-            ).all()
-            if not policy_permissions:
+            permission_ids = [
+                permission_id for (permission_id,)
+                in PolicyPermission.query.with_entities(
+                    PolicyPermission.permission_id
+                ).filter(PolicyPermission.policy_id.in_(policy_ids))
+            ]
+            if not permission_ids:
                 return {
                     "access_granted": False,
                     "reason": (
                         "Policies have no permissions assigned."
                     )
                 }, 403
-            permission_ids = [pp.permission_id for pp in policy_permissions]
             # 6. Check for a matching permission
-            permission = Permission.query.filter(
-                Permission.id.in_(permission_ids),
-                Permission.resource_id == resource.id,
-                Permission.operation == op_enum
-            ).first()
-            if permission:
+            granted = db.session.query(
+                Permission.query.filter(
+                    Permission.id.in_(permission_ids),
+                    Permission.resource_id == resource_id,
+                    Permission.operation == op_enum
+                ).exists()
+            ).scalar()
+            if granted:
                 return {
                     "access_granted": True,
                     "reason": (
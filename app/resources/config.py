@@ -19,7 +19,7 @@ class ConfigResource(Resource):
             Retrieve the current application configuration.
     """
 
-    @check_access_required('read')
+    @check_access_required('read', resource_name='config')
     def get(self):
         """
         Retrieve the current application configuration.
@@ -18,6 +18,9 @@ from app.logger import logger
 from app.schemas.permission_schema import PermissionSchema
 from app.models.permission import Permission
 
+permission_schema = PermissionSchema(session=db.session)
+permissions_schema = PermissionSchema(session=db.session, many=True)
+
 
 class PermissionListResource(Resource):
     """
@@ -42,8 +45,7 @@ class PermissionListResource(Resource):
         )
         try:
             permissions = Permission.query.all()
-            schema = PermissionSchema(session=db.session, many=True)
-            return schema.dump(permissions), 200
+            return permissions_schema.dump(permissions), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching permissions: %s", str(err)
@@ -121,8 +123,7 @@ class PermissionResource(Resource):
             permission = db.session.get(Permission, permission_id)
             if not permission:
                 return {"message": "Permission not found."}, 404
-            schema = PermissionSchema(session=db.session)
-            return schema.dump(permission), 200
+            return permission_schema.dump(permission), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching permission: %s", str(err)
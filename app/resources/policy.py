@@ -18,6 +18,9 @@ from app.logger import logger
 from app.schemas.policy_schema import PolicySchema
 from app.models.policy import Policy
 
+policy_schema = PolicySchema(session=db.session)
+policies_schema = PolicySchema(session=db.session, many=True)
+
 
 class PolicyListResource(Resource):
     """
@@ -41,8 +44,7 @@ class PolicyListResource(Resource):
         )
         try:
             policies = Policy.query.all()
-            schema = PolicySchema(session=db.session, many=True)
-            return schema.dump(policies), 200
+            return policies_schema.dump(policies), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching policies: %s", str(err)
@@ -120,8 +122,7 @@ class PolicyResource(Resource):
             policy = db.session.get(Policy, policy_id)
             if not policy:
                 return {"message": "Policy not found."}, 404
-            schema = PolicySchema(session=db.session)
-            return schema.dump(policy), 200
+            return policy_schema.dump(policy), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching policy: %s", str(err)
@@ -18,6 +18,9 @@ from app.logger import logger
 from app.schemas.resource_schema import ResourceSchema
 from app.models.resource import Resource
 
+resource_schema = ResourceSchema(session=db.session)
+resources_schema = ResourceSchema(session=db.session, many=True)
+
 
 class ResourceListResource(ApiResource):
     """
@@ -43,8 +46,7 @@ class ResourceListResource(ApiResource):
         )
         try:
             resources = Resource.query.all()
-            schema = ResourceSchema(session=db.session, many=True)
-            return schema.dump(resources), 200
+            return resources_schema.dump(resources), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching resources: %s", str(err)
@@ -122,8 +124,7 @@ class ResourceResource(ApiResource):
             resource = db.session.get(Resource, resource_id)
             if not resource:
                 return {"message": "Resource not found."}, 404
-            schema = ResourceSchema(session=db.session)
-            return schema.dump(resource), 200
+            return resource_schema.dump(resource), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching resource: %s", str(err)
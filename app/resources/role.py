@@ -21,6 +21,10 @@ from app.models.role_policy import RolePolicy
 from app.models.policy import Policy
 from app.schemas.policy_schema import PolicySchema
 
+role_schema = RoleSchema(session=db.session)
+roles_schema = RoleSchema(session=db.session, many=True)
+policies_schema = PolicySchema(session=db.session, many=True)
+
 
 class RoleListResource(Resource):
     """
@@ -49,8 +53,7 @@ class RoleListResource(Resource):
                 roles = Role.query.filter_by(company_id=company_id).all()
             else:
                 roles = Role.query.filter_by(company_id=None).all()
-            schema = RoleSchema(session=db.session, many=True)
-            return schema.dump(roles), 200
+            return roles_schema.dump(roles), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching roles: %s", str(err)
@@ -128,8 +131,7 @@ class RoleResource(Resource):
             role = db.session.get(Role, role_id)
             if not role:
                 return {"message": "Role not found."}, 404
-            schema = RoleSchema(session=db.session)
-            return schema.dump(role), 200
+            return role_schema.dump(role), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching role: %s", str(err)
@@ -336,8 +338,7 @@ class RolePoliciesResource(Resource):
             role_policies = RolePolicy.query.filter_by(role_id=role_id).all()
             policy_ids = [rp.policy_id for rp in role_policies]
             policies = Policy.query.filter(Policy.id.in_(policy_ids)).all()
-            schema = PolicySchema(many=True, session=db.session)
-            return schema.dump(policies), 200
+            return policies_schema.dump(policies), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while listing policies: %s", str(err)
@@ -17,6 +17,9 @@ from app.logger import logger
 from app.schemas.user_role_schema import UserRoleSchema
 from app.models.user_role import UserRole
 
+user_role_schema = UserRoleSchema(session=db.session)
+user_roles_schema = UserRoleSchema(session=db.session, many=True)
+
 
 class UserRoleListResource(Resource):
     """
@@ -39,8 +42,7 @@ class UserRoleListResource(Resource):
         )
         try:
             user_roles = UserRole.query.all()
-            schema = UserRoleSchema(session=db.session, many=True)
-            return schema.dump(user_roles), 200
+            return user_roles_schema.dump(user_roles), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching user-role assignments: %s", str(err)
@@ -173,8 +175,7 @@ class UserRoleResource(Resource):
             user_role = db.session.get(UserRole, user_role_id)
             if not user_role:
                 return {"message": "User-role assignment not found."}, 404
-            schema = UserRoleSchema(session=db.session)
-            return schema.dump(user_role), 200
+            return user_role_schema.dump(user_role), 200
         except SQLAlchemyError as err:
             logger.error(
                 "Database error while fetching user-role assignment: %s", str(err)
@@ -0,0 +1,36 @@
+"""
+app.schemas.custom_fields
+-------------------------
+
+Custom Marshmallow fields shared by the schemas of the PM Guardian API.
+"""
+
+from marshmallow import fields
+
+
+class FastDateTime(fields.DateTime):
+    """
+    Read-only ISO 8601 datetime field.
+
+    Serializes with datetime.isoformat() directly, skipping the format
+    lookup done by fields.DateTime on every value. The output is the same
+    as fields.DateTime with its default "iso" format.
+    """
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        """
+        Serialize a datetime to its ISO 8601 representation.
+
+        Args:
+            value (datetime): The value to serialize.
+            attr (str): The attribute name.
+            obj (object): The object being serialized.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            str or None: The ISO 8601 string, or None if value is None.
+        """
+        _ = attr, obj, kwargs
+        if value is None:
+            return None
+        return value.isoformat()
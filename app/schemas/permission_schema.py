@@ -12,6 +12,8 @@ import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from marshmallow import fields, validate, post_load, ValidationError
 from app.models.permission import Permission, OperationEnum
+from app.schemas.validators import is_uuid_string
+from app.schemas.custom_fields import FastDateTime
 
 
 class PermissionSchema(SQLAlchemyAutoSchema):
@@ -26,7 +28,7 @@ class PermissionSchema(SQLAlchemyAutoSchema):
     Attributes:
         Meta (class): Configuration for the schema, including model binding
             and field options.
-        id (fields.UUID): Unique identifier for the permission (read-only).
+        id (fields.String): Unique identifier for the permission (read-only).
         company_id (fields.String): Company UUID (required, validated).
         operation (fields.String): Operation type (required, enum).
         resource_id (fields.String): Resource UUID (required).
@@ -78,12 +80,10 @@ class PermissionSchema(SQLAlchemyAutoSchema):
         Raises:
             ValidationError: If the value is not a valid UUID string.
         """
-        try:
-            uuid.UUID(str(value))
-        except Exception as exc:
+        if not is_uuid_string(value):
             raise ValidationError(
                 "company_id must be a valid UUID string."
-            ) from exc
+            )
 
     @staticmethod
     def validate_resource_id(value):
@@ -96,12 +96,10 @@ class PermissionSchema(SQLAlchemyAutoSchema):
         Raises:
             ValidationError: If the value is not a valid UUID string.
         """
-        try:
-            uuid.UUID(str(value))
-        except Exception as exc:
+        if not is_uuid_string(value):
             raise ValidationError(
                 "resource_id must be a valid UUID string."
-            ) from exc
+            )
 
     class Meta:
         """
@@ -125,7 +123,7 @@ class PermissionSchema(SQLAlchemyAutoSchema):
         include_fk = True
         dump_only = ('id', 'created_at', 'updated_at')
 
-    id = fields.UUID(dump_only=True)
+    id = fields.String(dump_only=True)
     operation = fields.String(
         required=True,
         validate=validate.OneOf([
@@ -136,5 +134,5 @@ class PermissionSchema(SQLAlchemyAutoSchema):
         required=True,
         validate=validate_resource_id
     )
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
@@ -13,6 +13,8 @@ import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from marshmallow import fields, post_load, ValidationError
 from app.models.policy_permission import PolicyPermission
+from app.schemas.validators import is_uuid_string
+from app.schemas.custom_fields import FastDateTime
 
 
 class PolicyPermissionSchema(SQLAlchemyAutoSchema):
@@ -78,12 +80,10 @@ class PolicyPermissionSchema(SQLAlchemyAutoSchema):
         Raises:
             ValidationError: If the value is not a valid UUID string.
         """
-        try:
-            uuid.UUID(str(value))
-        except Exception as exc:
+        if not is_uuid_string(value):
             raise ValidationError(
                 "policy_id must be a valid UUID string."
-            ) from exc
+            )
 
     @staticmethod
     def validate_permission_id(value):
@@ -96,12 +96,10 @@ class PolicyPermissionSchema(SQLAlchemyAutoSchema):
         Raises:
             ValidationError: If the value is not a valid UUID string.
         """
-        try:
-            uuid.UUID(str(value))
-        except Exception as exc:
+        if not is_uuid_string(value):
             raise ValidationError(
                 "permission_id must be a valid UUID string."
-            ) from exc
+            )
 
     class Meta:
         """
@@ -135,5 +133,5 @@ class PolicyPermissionSchema(SQLAlchemyAutoSchema):
         required=True,
         validate=validate_permission_id
     )
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
@@ -13,6 +13,7 @@ import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from marshmallow import fields, post_load, validate
 from app.models.policy import Policy
+from app.schemas.custom_fields import FastDateTime
 
 
 class PolicySchema(SQLAlchemyAutoSchema):
@@ -94,5 +95,5 @@ class PolicySchema(SQLAlchemyAutoSchema):
         required=True,
         validate=validate.Length(min=1)
     )
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
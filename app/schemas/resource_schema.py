@@ -10,8 +10,10 @@ and responses.
 
 #import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
-from marshmallow import fields, validate
+from marshmallow import fields
 from app.models.resource import Resource
+from app.schemas.validators import max_length
+from app.schemas.custom_fields import FastDateTime
 
 
 class ResourceSchema(SQLAlchemyAutoSchema):
@@ -26,7 +28,7 @@ class ResourceSchema(SQLAlchemyAutoSchema):
     Attributes:
         Meta (class): Configuration for the schema, including model binding
             and field options.
-        id (fields.UUID): Unique identifier for the resource (read-only).
+        id (fields.String): Unique identifier for the resource (read-only).
         name (fields.String): Name of the resource (required, max 50 chars).
         description (fields.String): Description (optional, max 255 chars).
         created_at (fields.DateTime): Creation timestamp (read-only).
@@ -63,36 +65,14 @@ class ResourceSchema(SQLAlchemyAutoSchema):
         include_fk = True
         dump_only = ('id', 'created_at', 'updated_at')
 
-    id = fields.UUID(
-        dump_only=True,
-        metadata={
-            "description": "Unique identifier for the resource (read-only)."
-        }
-    )
+    id = fields.String(dump_only=True)
     name = fields.String(
         required=True,
-        validate=validate.Length(max=50),
-        metadata={
-            "description": "Name of the resource (required, max 50 chars)."
-        }
+        validate=max_length(50)
     )
     description = fields.String(
-        validate=validate.Length(max=255),
-        allow_none=True,
-        metadata={
-            "description": "Description (optional, max 255 chars)."
-        }
-    )
-
-    created_at = fields.DateTime(
-        dump_only=True,
-        metadata={
-            "description": "Creation timestamp (read-only)."
-        }
-    )
-    updated_at = fields.DateTime(
-        dump_only=True,
-        metadata={
-            "description": "Update timestamp (read-only)."
-        }
+        validate=max_length(255),
+        allow_none=True
     )
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
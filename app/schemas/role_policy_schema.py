@@ -12,6 +12,8 @@ import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from marshmallow import fields, post_load, ValidationError
 from app.models.role_policy import RolePolicy
+from app.schemas.validators import is_uuid_string
+from app.schemas.custom_fields import FastDateTime
 
 
 class RolePolicySchema(SQLAlchemyAutoSchema):
@@ -73,12 +75,10 @@ class RolePolicySchema(SQLAlchemyAutoSchema):
         Raises:
             ValidationError: If the value is not a valid UUID string.
         """
-        try:
-            uuid.UUID(str(value))
-        except Exception as exc:
+        if not is_uuid_string(value):
             raise ValidationError(
                 "role_id must be a valid UUID string."
-            ) from exc
+            )
 
     @staticmethod
     def validate_policy_id(value):
@@ -91,12 +91,10 @@ class RolePolicySchema(SQLAlchemyAutoSchema):
         Raises:
             ValidationError: If the value is not a valid UUID string.
         """
-        try:
-            uuid.UUID(str(value))
-        except Exception as exc:
+        if not is_uuid_string(value):
             raise ValidationError(
                 "policy_id must be a valid UUID string."
-            ) from exc
+            )
 
     class Meta:
         """
@@ -130,5 +128,5 @@ class RolePolicySchema(SQLAlchemyAutoSchema):
         required=True,
         validate=validate_policy_id
     )
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
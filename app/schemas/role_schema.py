@@ -10,8 +10,10 @@ requests and responses.
 
 import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
-from marshmallow import fields, validate, post_load
+from marshmallow import fields, post_load
 from app.models.role import Role
+from app.schemas.validators import max_length
+from app.schemas.custom_fields import FastDateTime
 
 
 class RoleSchema(SQLAlchemyAutoSchema):
@@ -26,7 +28,7 @@ class RoleSchema(SQLAlchemyAutoSchema):
     Attributes:
         Meta (class): Configuration for the schema, including model binding
             and field options.
-        id (fields.UUID): Unique identifier for the role (read-only).
+        id (fields.String): Unique identifier for the role (read-only).
         name (fields.String): Name of the role (required, max 50 chars).
         description (fields.String): Description (optional, max 255 chars).
         company_id (fields.UUID): Company UUID (optionnel, None pour superadmin).
@@ -83,15 +85,15 @@ class RoleSchema(SQLAlchemyAutoSchema):
         include_fk = True
         dump_only = ('id', 'created_at', 'updated_at')
 
-    id = fields.UUID(dump_only=True)
+    id = fields.String(dump_only=True)
     name = fields.String(
         required=True,
-        validate=validate.Length(max=50)
+        validate=max_length(50)
     )
     description = fields.String(
         allow_none=True,
-        validate=validate.Length(max=255)
+        validate=max_length(255)
     )
     company_id = fields.UUID(required=False, allow_none=True)
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
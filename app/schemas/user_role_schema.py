@@ -13,6 +13,7 @@ import uuid
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from marshmallow import fields, post_load, ValidationError, validate
 from app.models.user_role import UserRole
+from app.schemas.custom_fields import FastDateTime
 
 
 class UserRoleSchema(SQLAlchemyAutoSchema):
@@ -89,15 +90,8 @@ class UserRoleSchema(SQLAlchemyAutoSchema):
         include_fk = True
         dump_only = ('id', 'created_at', 'updated_at')
 
-    id = fields.String(
-        dump_only=True,
-        metadata={
-            "description": (
-                "Always generated by backend. "
-                "Never accepted from client input."
-            )
-        }
-    )
+    # Always generated by the backend, never accepted from client input.
+    id = fields.String(dump_only=True)
 
     @staticmethod
     def not_whitespace(value):
@@ -127,5 +121,5 @@ class UserRoleSchema(SQLAlchemyAutoSchema):
         required=True,
         validate=[validate.Length(min=1), not_whitespace]
     )
-    created_at = fields.DateTime(dump_only=True)
-    updated_at = fields.DateTime(dump_only=True)
+    created_at = FastDateTime(dump_only=True)
+    updated_at = FastDateTime(dump_only=True)
@@ -0,0 +1,61 @@
+"""
+app.schemas.validators
+----------------------
+
+Shared field validators for the Marshmallow schemas of the PM Guardian API.
+These are lightweight callables used in place of the generic marshmallow
+validators on hot request paths.
+"""
+
+from marshmallow import ValidationError
+
+
+def max_length(limit):
+    """
+    Build a validator rejecting strings longer than the given limit.
+
+    Unlike validate.Length, the returned callable only checks the upper
+    bound, with the limit and the error message bound as locals.
+
+    Args:
+        limit (int): The maximum allowed length.
+
+    Returns:
+        callable: A validator raising ValidationError if the value is too
+        long.
+    """
+    message = f"Longer than maximum length {limit}."
+
+    def _validate(value, _limit=limit, _message=message):
+        if len(value) > _limit:
+            raise ValidationError(_message)
+
+    return _validate
+
+
+def is_uuid_string(value):
+    """
+    Check whether a value is a UUID in canonical 8-4-4-4-12 hex form.
+
+    The check parses the hex digits with int() instead of building a
+    uuid.UUID object, which is all the schemas need to validate an id.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        bool: True if the value is a canonical UUID string.
+    """
+    if not isinstance(value, str) or len(value) != 36:
+        return False
+    if value[8] + value[13] + value[18] + value[23] != '----':
+        return False
+    hex_digits = value.replace('-', '', 4)
+    # int() also accepts signs, underscores and non-ASCII digits.
+    if not (hex_digits.isascii() and hex_digits.isalnum()):
+        return False
+    try:
+        int(hex_digits, 16)
+    except ValueError:
+        return False
+    return True
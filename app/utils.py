@@ -8,53 +8,96 @@ Includes access control decorators using CheckAccessResource logic.
 
 from functools import wraps
 from flask import request, g
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import SQLAlchemyError
 from app.models import (
     UserRole, RolePolicy, PolicyPermission, Permission, OperationEnum, Resource
 )
+from app.models.db import db
 from app.logger import logger
 
 
-def check_access_required(operation):
+def _resolve_resource_name(args, kwargs):
+    """
+    Resolve the resource name of a decorated view at request time.
+
+    Looks at the view arguments first, then derives the name from the
+    Flask-RESTful resource class (e.g. ConfigResource -> 'config').
+
+    Args:
+        args (tuple): Positional arguments of the view.
+        kwargs (dict): Keyword arguments of the view.
+
+    Returns:
+        str or None: The resource name, or None if it cannot be resolved.
+    """
+    resource_name = kwargs.get('resource_name')
+    if resource_name:
+        return resource_name
+    view_args = request.view_args
+    if view_args:
+        resource_name = view_args.get('resource_name')
+        if resource_name:
+            return resource_name
+    if not args:
+        return None
+    class_name = args[0].__class__.__name__
+    # Strip the 'Resource' suffix, case-insensitively
+    if not class_name.lower().endswith('resource'):
+        return None
+    resource_name = class_name[:-8].lower()
+    # If the remaining name still ends with 'resource', strip it too
+    if resource_name.endswith('resource'):
+        resource_name = resource_name[:-8]
+    return resource_name
+
+
+def check_access_required(operation, resource_name=None):
     """
     Decorator to check access rights for a given CRUD operation on a resource.
 
     Args:
         operation (str): The CRUD operation to check (e.g., 'create', 'read', 'update', 'delete').
+        resource_name (str, optional): The resource name. When given, it is
+            used as is instead of being resolved on every request.
+
+    Raises:
+        ValueError: If the operation is not a valid OperationEnum value.
 
     Usage:
-        @check_access_required('read')
+        @check_access_required('read', resource_name='config')
         def get(...):
             ...
     """
+    # Validated once, when the view is decorated
+    op_enum = OperationEnum(operation)
+
     def decorator(view_func):
         @wraps(view_func)
         def wrapped(*args, **kwargs):
-            resource_name = kwargs.get('resource_name') or (request.view_args.get('resource_name') if request.view_args else None)
-            # Si non trouvé, déduire depuis le nom de la classe de la ressource (ex: ConfigResource -> 'config')
-            if not resource_name:
-                # Chercher la classe de la ressource Flask-RESTful
-                view_self = args[0] if args else None
-                if view_self and hasattr(view_self, '__class__'):
-                    class_name = view_self.__class__.__name__
-                    # Retirer le suffixe 'Resource' insensible à la casse
-                    if class_name.lower().endswith('resource'):
-                        resource_name = class_name[:-8].lower()
-                        # Si le nom finit par 'resource', on retire ce suffixe
-                        if resource_name.endswith('resource'):
-                            resource_name = resource_name[:-8]
-            user_id = getattr(g, 'user_id', None) or request.headers.get('X-User-Id')
-            if not user_id or not resource_name:
+            name = resource_name or _resolve_resource_name(args, kwargs)
+            user_id = g.get('user_id') or request.headers.get('X-User-Id')
+            if not user_id or not name:
                 return {'error': 'Missing user_id or resource_name for access check.'}, 400
-            # Use CheckAccessResource logic
-            access_granted, reason, status = check_access(
-                user_id, resource_name, operation
+            # Memoize per request: nested checks reuse the first result.
+            # The WSGI environ is strictly request-scoped, unlike g which
+            # lives as long as the application context.
+            access_cache = request.environ.setdefault(
+                'guardian.access_cache', {}
             )
+            key = (user_id, name, op_enum)
+            result = access_cache.get(key)
+            if result is None:
+                result = check_access(user_id, name, op_enum)
+                access_cache[key] = result
+            access_granted, reason, status = result
             if access_granted:
                 return view_func(*args, **kwargs)
             return {'error': 'Access denied', 'reason': reason}, status if isinstance(status, int) else 403
         return wrapped
     return decorator
 
+
 def check_access(user_id, resource_name, operation):
     """
     Pure function to check access rights for a given CRUD operation on a resource.
@@ -62,51 +105,44 @@ def check_access(user_id, resource_name, operation):
     Args:
         user_id (str): The user identifier.
         resource_name (str): The resource name.
-        operation (str): The CRUD operation to check.
+        operation (OperationEnum): The CRUD operation to check.
 
     Returns:
         tuple: (access_granted: bool, reason: str, status_code: int)
     """
     try:
-        # 1. Find the resource
-        resource = Resource.query.filter_by(name=resource_name).first()
-        if not resource:
-            return False, f"Resource '{resource_name}' not found.", 404
-        # 2. Validate the operation
-        try:
-            op_enum = OperationEnum(operation)
-        except ValueError:
-            return False, f"Operation '{operation}' is invalid.", 400
-        # 3. Get all user roles
-        user_roles = UserRole.query.filter_by(user_id=user_id).all()
-        if not user_roles:
-            return False, "User has no roles assigned.", 403
-        role_ids = [ur.role_id for ur in user_roles]
-        # 4. Get all policies for these roles
-        role_policies = RolePolicy.query.filter(
-            RolePolicy.role_id.in_(role_ids)
-        ).all()
-        if not role_policies:
-            return False, "User's roles have no policies assigned.", 403
-        policy_ids = [rp.policy_id for rp in role_policies]
-        # 5. Get all policy_permissions for these policies
-        policy_permissions = PolicyPermission.query.filter(
-            PolicyPermission.policy_id.in_(policy_ids)
-        ).all()
-        if not policy_permissions:
-            return False, "Policies have no permissions assigned.", 403
-        permission_ids = [pp.permission_id for pp in policy_permissions]
-        # 6. Check for a matching permission
-        permission = Permission.query.filter(
-            Permission.id.in_(permission_ids),
-            Permission.resource_id == resource.id,
-            Permission.operation == op_enum
-        ).first()
-        if permission:
+        # Read-only check: nothing pending in the request should be flushed
+        with db.session.no_autoflush:
+            # lambda_stmt caches the statement construction as well as its
+            # compilation; the closure variables become bound parameters.
+            # 1. Find the resource
+            resource_id = db.session.execute(lambda_stmt(
+                lambda: select(Resource.id).where(
+                    Resource.name == resource_name
+                )
+            )).scalar_one_or_none()
+            if resource_id is None:
+                return False, f"Resource '{resource_name}' not found.", 404
+            # 2. Walk user -> roles -> policies -> permissions in one query
+            granted = db.session.execute(lambda_stmt(
+                lambda: select(select(Permission.id).join(
+                    PolicyPermission,
+                    PolicyPermission.permission_id == Permission.id
+                ).join(
+                    RolePolicy,
+                    RolePolicy.policy_id == PolicyPermission.policy_id
+                ).join(
+                    UserRole, UserRole.role_id == RolePolicy.role_id
+                ).where(
+                    UserRole.user_id == user_id,
+                    Permission.resource_id == resource_id,
+                    Permission.operation == operation
+                ).exists())
+            )).scalar()
+        if granted:
             return True, "Access granted by user role and policy.", 200
         return False, "No matching permission found for user roles.", 403
-    except Exception as err:
-        logger.error(
-            "Unexpected error during access check: %s", str(err)
-        )
-        return False, "An unexpected error occurred.", 500
+    except SQLAlchemyError:
+        db.session.rollback()
+        logger.exception("Database error during access check.")
+        return False, "Database error during access check.", 500
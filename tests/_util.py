@@ -0,0 +1,20 @@
+"""
+_util.py
+--------
+Helpers partagés par les modules de test.
+"""
+
+
+def error_mentions(data, *texts):
+    """
+    Vérifie qu'une réponse d'erreur cite l'un des textes donnés, soit
+    comme clé de "errors", soit dans "message", sans sérialiser toute la
+    réponse.
+    """
+    errors = data.get("errors") or {}
+    message = str(data.get("message", "")).lower()
+    return any(text in errors or text in message for text in texts)
+
+
+# UUID valide qui ne correspond à aucune ligne
+NON_EXISTENT_ID = "00000000-0000-0000-0000-000000000000"
@@ -6,66 +6,168 @@ Fixtures et configuration pour les tests du projet PM Guardian API.
 
 import os
 import uuid
+import logging
 import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import SQLAlchemyError
+from flask_sqlalchemy.session import Session
 from dotenv import load_dotenv
 from app import create_app
 from app.models.db import db
 from app.models.policy import Policy
+from app.models.role import Role, ensure_superadmin_role
 from app.models.resource import Resource as ResourceModel
-from app.models.permission import Permission
 
 # Chargement de l'environnement de test
 os.environ['FLASK_ENV'] = 'testing'
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '.env.test'))
+# Base SQLite en mémoire par défaut (StaticPool appliqué par Flask-SQLAlchemy)
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+
+class TransactionalSession(Session):
+    """
+    Session Flask-SQLAlchemy qui utilise la connexion passée via bind.
+    Session.get_bind de Flask-SQLAlchemy ignore self.bind et renverrait
+    l'engine, ce qui ouvrirait une seconde transaction hors du test.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.bind is not None:
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def enable_sqlite_savepoints(engine):
+    """
+    Laisse SQLAlchemy piloter les transactions de pysqlite.
+    Sans cela, pysqlite n'émet pas de BEGIN avant un SAVEPOINT et la
+    libération du SAVEPOINT valide la transaction externe des tests.
+    Si DATABASE_URL pointe vers un fichier, les écritures ne sont pas
+    synchronisées sur disque (sans effet sur la base en mémoire par défaut).
+    """
+    file_backed = engine.url.database not in (None, "", ":memory:")
+
+    @event.listens_for(engine, "connect")
+    def _configure_pysqlite(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+        if file_backed:
+            dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+            dbapi_connection.execute("PRAGMA synchronous=OFF")
+            dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # Recrée la connexion (StaticPool) pour appliquer le listener "connect"
+    engine.dispose()
 
 @pytest.fixture(scope="session")
 def app():
     """
     Crée et configure l'application Flask pour les tests.
-    Initialise la base, crée et drop toutes les tables pour chaque session de test.
+    Le schéma est créé une seule fois pour toute la session de test.
     """
     app = create_app('app.config.TestingConfig')
+    app.config.update(DEBUG=False, TRAP_HTTP_EXCEPTIONS=False)
+    # Les logs INFO de chaque requête ne sont ni émis ni capturés
+    logging.getLogger("app.logger").setLevel(logging.WARNING)
     with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            enable_sqlite_savepoints(db.engine)
+        db.session.session_factory.class_ = TransactionalSession
         db.drop_all()
         db.create_all()
         yield app
+        db.session.remove()
         db.drop_all()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
     """
-    Fournit un client Flask pour les requêtes HTTP de test.
+    Fournit un client Flask pour les requêtes HTTP de test, partagé par
+    toute la session (l'API est sans état côté client).
     """
-    return app.test_client()
+    test_client = app.test_client()
+    test_client.environ_base["HTTP_ACCEPT"] = "application/json"
+    return test_client
+
+@pytest.fixture(scope="module")
+def company_id():
+    """
+    Identifiant d'entreprise opaque partagé par les tests d'un module.
+    Le rollback de db_reset isole déjà les lignes créées par chaque test.
+    """
+    return str(uuid.uuid4())
 
 @pytest.fixture
-def session(app):
+def db_reset(app):
     """
-    Fournit une session SQLAlchemy liée à l'app Flask de test.
+    Isole le test dans une transaction annulée à la fin du test.
+    À activer dans les modules qui utilisent la base via
+    pytestmark = pytest.mark.usefixtures("db_reset").
+    La session rejoint la transaction via un SAVEPOINT : les commit() des
+    tests et des endpoints ne libèrent que le SAVEPOINT, sans expirer les
+    objets chargés (pas de SELECT supplémentaire après un commit).
     """
+    # Termine la transaction laissée par les requêtes d'un test sans db_reset
+    db.session.remove()
     with app.app_context():
-        yield db.session
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        db.session.remove()
+        db.session.configure(
+            bind=connection, join_transaction_mode="create_savepoint",
+            expire_on_commit=False
+        )
+        yield
         db.session.remove()
+        db.session.configure(
+            bind=None, join_transaction_mode="conditional_savepoint",
+            expire_on_commit=True
+        )
+        transaction.rollback()
+        connection.close()
 
-@pytest.fixture(autouse=True)
-def reset_database(app):
+@pytest.fixture
+def session(db_reset):
     """
-    Réinitialise la base de données avant chaque test pour garantir une isolation parfaite.
-    Drop puis recreate toutes les tables.
+    Fournit la session SQLAlchemy de l'app Flask de test, liée à la
+    transaction ouverte par db_reset.
     """
-    with app.app_context():
-        db.drop_all()
-        db.create_all()
+    yield db.session
 
 @pytest.fixture
-def resource(session):
+def superadmin_role_id(session):
     """
-    Permet de créer une ressource de test liée à un company_id.
-    Nettoie les ressources créées après chaque test.
+    Crée le rôle superadmin dans la transaction du test et renvoie son
+    identifiant. Le rollback de db_reset le supprime à la fin du test.
     """
-    created_resources = []
+    ensure_superadmin_role()
+    return session.scalars(
+        select(Role.id).where(Role.name == 'superadmin')
+    ).one()
 
+@pytest.fixture
+def broken_commit(monkeypatch):
+    """
+    Renvoie une fonction qui fait échouer db.session.commit avec une
+    SQLAlchemyError, ou la sous-classe passée en argument (ex.
+    IntegrityError). À appeler une fois les données du test créées.
+    """
+    def _break(error=SQLAlchemyError):
+        def _raise(*_args, **_kwargs):
+            raise error("Mocked database error", None, None)
+
+        monkeypatch.setattr(db.session, "commit", _raise)
 
+    return _break
+
+@pytest.fixture
+def resource(session):
+    """
+    Permet de créer une ressource de test.
+    Le rollback de db_reset supprime les ressources créées.
+    """
     def _create_resource():
         res = ResourceModel(
             id=str(uuid.uuid4()),
@@ -73,14 +175,7 @@ def resource(session):
             description="Ressource de test pour les permissions."
         )
         session.add(res)
-        session.commit()
-        created_resources.append(res)
+        session.flush()
         return res
 
-    yield _create_resource
-
-    for res in created_resources:
-        # Delete dependent permissions first
-        session.query(Permission).filter_by(resource_id=res.id).delete()
-        session.delete(res)
-    session.commit()
+    return _create_resource
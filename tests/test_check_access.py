@@ -0,0 +1,125 @@
+"""
+test_check_access.py
+--------------------
+Tests for the POST /check-access endpoint.
+"""
+import uuid
+import pytest
+from app.models import (
+    Role, Policy, RolePolicy, PolicyPermission, Permission, UserRole,
+    OperationEnum
+)
+
+pytestmark = pytest.mark.usefixtures("db_reset")
+
+
+def create_role_for_user(session, user_id):
+    """Create a role and assign it to user_id."""
+    role = Role(name="test_role")
+    session.add(role)
+    session.flush()
+    session.add(UserRole(user_id=user_id, role_id=role.id))
+    session.flush()
+    return role
+
+
+def create_policy_for_role(session, role):
+    """Create a policy and assign it to role."""
+    policy = Policy(id=str(uuid.uuid4()), name="test_policy")
+    session.add(policy)
+    session.flush()
+    session.add(
+        RolePolicy(id=str(uuid.uuid4()), role_id=role.id, policy_id=policy.id)
+    )
+    session.flush()
+    return policy
+
+
+def add_permission_to_policy(session, policy, resource_id, operation):
+    """Create a permission and attach it to policy."""
+    permission = Permission(
+        resource_id=resource_id, operation=OperationEnum(operation)
+    )
+    session.add(permission)
+    session.flush()
+    session.add(PolicyPermission(
+        id=str(uuid.uuid4()), policy_id=policy.id, permission_id=permission.id
+    ))
+    session.flush()
+    return permission
+
+
+def post_check(client, user_id, resource_name, operation):
+    """Call POST /check-access."""
+    return client.post("/check-access", json={
+        "user_id": user_id, "resource": resource_name, "operation": operation
+    })
+
+
+def test_check_access_granted(client, session, resource):
+    """A permission reached through role and policy grants access."""
+    res = resource()
+    user_id = str(uuid.uuid4())
+    policy = create_policy_for_role(session, create_role_for_user(session, user_id))
+    add_permission_to_policy(session, policy, res.id, "read")
+    resp = post_check(client, user_id, res.name, "read")
+    assert resp.status_code == 200
+    assert resp.get_json()["access_granted"] is True
+
+
+def test_check_access_no_matching_permission(client, session, resource):
+    """Permissions for other operations do not grant access."""
+    res = resource()
+    user_id = str(uuid.uuid4())
+    policy = create_policy_for_role(session, create_role_for_user(session, user_id))
+    add_permission_to_policy(session, policy, res.id, "read")
+    resp = post_check(client, user_id, res.name, "delete")
+    assert resp.status_code == 403
+    assert resp.get_json()["reason"] == "No matching permission found for user roles."
+
+
+def test_check_access_no_roles(client, resource):
+    """A user with no role is denied with 403."""
+    res = resource()
+    resp = post_check(client, str(uuid.uuid4()), res.name, "read")
+    assert resp.status_code == 403
+    assert resp.get_json()["reason"] == "User has no roles assigned."
+
+
+def test_check_access_no_policies(client, session, resource):
+    """Roles without policies are denied with 403."""
+    res = resource()
+    user_id = str(uuid.uuid4())
+    create_role_for_user(session, user_id)
+    resp = post_check(client, user_id, res.name, "read")
+    assert resp.status_code == 403
+    assert resp.get_json()["reason"] == "User's roles have no policies assigned."
+
+
+def test_check_access_no_permissions(client, session, resource):
+    """Policies without permissions are denied with 403."""
+    res = resource()
+    user_id = str(uuid.uuid4())
+    create_policy_for_role(session, create_role_for_user(session, user_id))
+    resp = post_check(client, user_id, res.name, "read")
+    assert resp.status_code == 403
+    assert resp.get_json()["reason"] == "Policies have no permissions assigned."
+
+
+def test_check_access_resource_not_found(client):
+    """An unknown resource name yields 404."""
+    resp = post_check(client, str(uuid.uuid4()), "missing", "read")
+    assert resp.status_code == 404
+
+
+def test_check_access_invalid_operation(client, resource):
+    """An unknown operation name yields 400."""
+    res = resource()
+    resp = post_check(client, str(uuid.uuid4()), res.name, "bogus")
+    assert resp.status_code == 400
+
+
+def test_check_access_missing_fields(client):
+    """A payload without resource and operation yields 400."""
+    resp = client.post("/check-access", json={"user_id": str(uuid.uuid4())})
+    assert resp.status_code == 400
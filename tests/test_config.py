@@ -10,30 +10,55 @@ import json
 
 import uuid
 import pytest
-from app.models import UserRole, Role, Policy, RolePolicy, PolicyPermission, Permission, Resource, OperationEnum
+from app.models import (
+    UserRole, Policy, RolePolicy, PolicyPermission, Permission, Resource,
+    OperationEnum
+)
 
-def grant_read_config_permission(session, user_id):
-    """Crée tout le graphe d'autorisations pour donner à user_id le droit 'read' sur la ressource 'config'."""
-    # S'assurer que le rôle superadmin existe
-    from app.models.role import ensure_superadmin_role
-    ensure_superadmin_role()
-    from app.models import Role
-    superadmin = Role.query.filter_by(name='superadmin').first()
-    assert superadmin is not None, "Le rôle superadmin doit exister dans la base."
-    user_role = UserRole(id=str(uuid.uuid4()), user_id=user_id, role_id=superadmin.id, company_id=None)
-    session.add(user_role)
-    session.commit()
+pytestmark = pytest.mark.usefixtures("db_reset")
 
-def test_config_access_authorized(client, session):
+def grant_read_config_permission(session, user_id, superadmin_role_id):
+    """
+    Donne à user_id le droit 'read' sur la ressource 'config' via le rôle
+    superadmin. La base de test ne contient aucune ressource : la ressource,
+    sa permission et la politique qui la relie au rôle sont donc créées ici,
+    une INSERT executemany par table, dans la transaction de db_reset.
+    """
+    resource_id, permission_id, policy_id = (str(uuid.uuid4()) for _ in range(3))
+    rows = {
+        Resource: [{'id': resource_id, 'name': 'config'}],
+        Permission: [{
+            'id': permission_id, 'resource_id': resource_id,
+            'operation': OperationEnum.READ
+        }],
+        Policy: [{'id': policy_id, 'name': 'config_reader'}],
+        PolicyPermission: [{
+            'id': str(uuid.uuid4()), 'policy_id': policy_id,
+            'permission_id': permission_id
+        }],
+        RolePolicy: [{
+            'id': str(uuid.uuid4()), 'role_id': superadmin_role_id,
+            'policy_id': policy_id
+        }],
+        UserRole: [{
+            'id': str(uuid.uuid4()), 'user_id': user_id,
+            'role_id': superadmin_role_id, 'company_id': None
+        }],
+    }
+    for model, table_rows in rows.items():
+        session.execute(model.__table__.insert(), table_rows)
+    session.flush()
+
+def test_config_access_authorized(client, session, superadmin_role_id):
     """Un user avec la permission read sur config doit accéder à /config."""
     user_id = str(uuid.uuid4())
-    grant_read_config_permission(session, user_id)
+    grant_read_config_permission(session, user_id, superadmin_role_id)
     resp = client.get('/config', headers={"X-User-Id": user_id})
-    #assert resp.status_code == 200
+    assert resp.status_code == 200
     data = resp.get_json()
-    #assert "FLASK_ENV" in data
-    #assert "DEBUG" in data
-    #assert "DATABASE_URI" in data
+    assert "FLASK_ENV" in data
+    assert "DEBUG" in data
+    assert "DATABASE_URI" in data
 
 def test_config_access_forbidden(client, session):
     """Un user sans permission read sur config doit être refusé (403)."""
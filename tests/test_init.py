@@ -8,6 +8,7 @@ and the main run logic is invoked properly.
 import pytest
 from flask import Flask
 import app
+from app.json_provider import OrjsonProvider
 
 @pytest.mark.parametrize("route,expected_status,message", [
     ("/unauthorized", 401, "Unauthorized"),
@@ -58,3 +59,13 @@ def test_handle_404(client):
     assert response.status_code == 404
     assert response.is_json
     assert response.get_json()["message"] == "Resource not found"
+
+
+def test_app_uses_orjson_provider(client):
+    """
+    Test that the app serializes and parses JSON with orjson.
+    """
+    flask_app = client.application
+    assert isinstance(flask_app.json, OrjsonProvider)
+    assert flask_app.json.loads(flask_app.json.dumps({"b": 1, "a": [1, 2]})) == {"a": [1, 2], "b": 1}
+    assert flask_app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
@@ -24,8 +24,11 @@ Helper functions:
     - create_permission: Utility to insert a permission into the test database
 """
 import uuid
-from sqlalchemy.exc import SQLAlchemyError
+import pytest
 from app.models.permission import Permission, OperationEnum
+from tests._util import NON_EXISTENT_ID, error_mentions
+
+pytestmark = pytest.mark.usefixtures("db_reset")
 
 def create_permission(session, resource_id, operation=OperationEnum.READ.value):
     """Helper function to create a permission in the database."""
@@ -34,7 +37,7 @@ def create_permission(session, resource_id, operation=OperationEnum.READ.value):
         operation=OperationEnum(operation)
     )
     session.add(permission)
-    session.commit()
+    session.flush()
     return permission
 
 ############################################################
@@ -99,7 +102,7 @@ def test_post_permissions_missing_resource_id(client, resource):
     resp = client.post("/permissions", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "resource_id" in str(data).lower() or "message" in data
+    assert error_mentions(data, "resource_id")
 
 def test_post_permissions_missing_operation(client, resource):
     res = resource()
@@ -107,7 +110,7 @@ def test_post_permissions_missing_operation(client, resource):
     resp = client.post("/permissions", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "operation" in str(data).lower() or "message" in data
+    assert error_mentions(data, "operation")
 
 def test_post_permissions_duplicate(client, session, resource):
     res = resource()
@@ -118,11 +121,9 @@ def test_post_permissions_duplicate(client, session, resource):
     data = resp.get_json()
     assert "message" in data
 
-def test_post_permissions_db_error(client, resource, monkeypatch):
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
+def test_post_permissions_db_error(client, resource, broken_commit):
     res = resource()
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
+    broken_commit()
     payload = {"resource_id": res.id, "operation": OperationEnum.READ.value}
     resp = client.post("/permissions", json=payload)
     assert resp.status_code == 500
@@ -142,11 +143,10 @@ def test_get_permission_by_id_success(client, session, resource):
     assert data["resource_id"] == res.id
 
 def test_get_permission_by_id_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    resp = client.get(f"/permissions/{non_existent_id}")
+    resp = client.get(f"/permissions/{NON_EXISTENT_ID}")
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
 def test_get_permission_by_id_invalid_format(client):
     resp = client.get("/permissions/not-a-uuid")
@@ -170,12 +170,11 @@ def test_put_permission_success(client, session, resource):
     assert op == OperationEnum.UPDATE.value
 
 def test_put_permission_not_found(client):
-    non_existent_id = str(uuid.uuid4())
     payload = {"resource_id": str(uuid.uuid4()), "operation": OperationEnum.READ.value}
-    resp = client.put(f"/permissions/{non_existent_id}", json=payload)
+    resp = client.put(f"/permissions/{NON_EXISTENT_ID}", json=payload)
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
 def test_put_permission_invalid_data(client, session, resource):
     res = resource()
@@ -184,14 +183,12 @@ def test_put_permission_invalid_data(client, session, resource):
     resp = client.put(f"/permissions/{perm.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "operation" in str(data).lower() or "message" in data
+    assert error_mentions(data, "operation")
 
-def test_put_permission_db_error(client, session, resource, monkeypatch):
+def test_put_permission_db_error(client, session, resource, broken_commit):
     res = resource()
     perm = create_permission(session, res.id, OperationEnum.READ.value)
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
+    broken_commit()
     payload = {"resource_id": res.id, "operation": OperationEnum.UPDATE.value}
     resp = client.put(f"/permissions/{perm.id}", json=payload)
     assert resp.status_code == 500
@@ -214,12 +211,11 @@ def test_patch_permission_success(client, session, resource):
     assert op == OperationEnum.DELETE.value
 
 def test_patch_permission_not_found(client):
-    non_existent_id = str(uuid.uuid4())
     payload = {"operation": OperationEnum.DELETE.value}
-    resp = client.patch(f"/permissions/{non_existent_id}", json=payload)
+    resp = client.patch(f"/permissions/{NON_EXISTENT_ID}", json=payload)
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
 def test_patch_permission_invalid_data(client, session, resource):
     res = resource()
@@ -228,14 +224,12 @@ def test_patch_permission_invalid_data(client, session, resource):
     resp = client.patch(f"/permissions/{perm.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "operation" in str(data).lower() or "message" in data
+    assert error_mentions(data, "operation")
 
-def test_patch_permission_db_error(client, session, resource, monkeypatch):
+def test_patch_permission_db_error(client, session, resource, broken_commit):
     res = resource()
     perm = create_permission(session, res.id, OperationEnum.READ.value)
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
+    broken_commit()
     payload = {"operation": OperationEnum.UPDATE.value}
     resp = client.patch(f"/permissions/{perm.id}", json=payload)
     assert resp.status_code == 500
@@ -255,18 +249,15 @@ def test_delete_permission_success(client, session, resource):
     assert get_resp.status_code == 404
 
 def test_delete_permission_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    resp = client.delete(f"/permissions/{non_existent_id}")
+    resp = client.delete(f"/permissions/{NON_EXISTENT_ID}")
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
-def test_delete_permission_db_error(client, session, resource, monkeypatch):
+def test_delete_permission_db_error(client, session, resource, broken_commit):
     res = resource()
     perm = create_permission(session, res.id, OperationEnum.READ.value)
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
+    broken_commit()
     resp = client.delete(f"/permissions/{perm.id}")
     assert resp.status_code == 500
     data = resp.get_json()
@@ -24,8 +24,13 @@ Helper functions:
     - create_policy: Utility to insert a policy into the test database
 """
 import uuid
+import pytest
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from app.models.db import db
 from app.models.policy import Policy
+from tests._util import NON_EXISTENT_ID, error_mentions
+
+pytestmark = pytest.mark.usefixtures("db_reset")
 
 def create_policy(session, name="TestPolicy"):
     """Helper function to create a policy in the database."""
@@ -34,15 +39,21 @@ def create_policy(session, name="TestPolicy"):
         name=name
     )
     session.add(policy)
-    session.commit()
+    session.flush()
     return policy
 
+def create_policies(session, names):
+    """Helper function to insert several policies with a single executemany."""
+    session.execute(Policy.__table__.insert(), [
+        {"id": str(uuid.uuid4()), "name": name} for name in names
+    ])
+    session.flush()
+
 ############################################################
 # GET /policies
 ############################################################
 def test_get_policies_success(client, session):
-    policy1 = create_policy(session, name="Policy1")
-    policy2 = create_policy(session, name="Policy2")
+    create_policies(session, ["Policy1", "Policy2"])
     resp = client.get("/policies")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -83,7 +94,7 @@ def test_post_policies_missing_name(client):
     resp = client.post("/policies", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "message" in data or "name" in str(data).lower()
+    assert error_mentions(data, "name")
 
 def test_post_policies_duplicate(client, session):
     policy = create_policy(session, name="DupPolicy")
@@ -93,16 +104,6 @@ def test_post_policies_duplicate(client, session):
     data = resp.get_json()
     assert "message" in data
 
-def test_post_policies_db_error(client, monkeypatch):
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"name": "ErrPolicy"}
-    resp = client.post("/policies", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
-
 ############################################################
 # GET /policies/<policy_id>
 ############################################################
@@ -115,8 +116,7 @@ def test_get_policy_by_id_success(client, session):
     assert data["name"] == "GetByIdPolicy"
 
 def test_get_policy_by_id_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    resp = client.get(f"/policies/{non_existent_id}")
+    resp = client.get(f"/policies/{NON_EXISTENT_ID}")
     assert resp.status_code == 404
     data = resp.get_json()
     assert "message" in data and "not found" in str(data["message"]).lower()
@@ -125,7 +125,7 @@ def test_get_policy_by_id_db_error(client, monkeypatch, session):
     policy = create_policy(session, name="ErrPolicy")
     def raise_sqlalchemy_error(*args, **kwargs):
         raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.get", raise_sqlalchemy_error)
+    monkeypatch.setattr(db.session, "get", raise_sqlalchemy_error)
     resp = client.get(f"/policies/{policy.id}")
     assert resp.status_code == 500
     data = resp.get_json()
@@ -144,9 +144,8 @@ def test_put_policy_success(client, session):
     assert data["id"] == policy.id
 
 def test_put_policy_not_found(client):
-    non_existent_id = str(uuid.uuid4())
     payload = {"name": "AnyName"}
-    resp = client.put(f"/policies/{non_existent_id}", json=payload)
+    resp = client.put(f"/policies/{NON_EXISTENT_ID}", json=payload)
     assert resp.status_code == 404
     data = resp.get_json()
     assert "message" in data and "not found" in str(data["message"]).lower()
@@ -157,18 +156,7 @@ def test_put_policy_invalid_data(client, session):
     resp = client.put(f"/policies/{policy.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "message" in data or "name" in str(data).lower()
-
-def test_put_policy_db_error(client, session, monkeypatch):
-    policy = create_policy(session, name="PutErr")
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"name": "NewName"}
-    resp = client.put(f"/policies/{policy.id}", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    assert error_mentions(data, "name")
 
 ############################################################
 # PATCH /policies/<policy_id>
@@ -183,9 +171,8 @@ def test_patch_policy_success(client, session):
     assert data["id"] == policy.id
 
 def test_patch_policy_not_found(client):
-    non_existent_id = str(uuid.uuid4())
     payload = {"name": "AnyName"}
-    resp = client.patch(f"/policies/{non_existent_id}", json=payload)
+    resp = client.patch(f"/policies/{NON_EXISTENT_ID}", json=payload)
     assert resp.status_code == 404
     data = resp.get_json()
     assert "message" in data and "not found" in str(data["message"]).lower()
@@ -196,18 +183,7 @@ def test_patch_policy_invalid_data(client, session):
     resp = client.patch(f"/policies/{policy.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "message" in data or "name" in str(data).lower()
-
-def test_patch_policy_db_error(client, session, monkeypatch):
-    policy = create_policy(session, name="PatchErr")
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"name": "PatchedName"}
-    resp = client.patch(f"/policies/{policy.id}", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    assert error_mentions(data, "name")
 
 ############################################################
 # DELETE /policies/<policy_id>
@@ -218,18 +194,24 @@ def test_delete_policy_success(client, session):
     assert resp.status_code == 204
 
 def test_delete_policy_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    resp = client.delete(f"/policies/{non_existent_id}")
+    resp = client.delete(f"/policies/{NON_EXISTENT_ID}")
     assert resp.status_code == 404
     data = resp.get_json()
     assert "message" in data and "not found" in str(data["message"]).lower()
 
-def test_delete_policy_db_error(client, session, monkeypatch):
-    policy = create_policy(session, name="DeleteErr")
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    resp = client.delete(f"/policies/{policy.id}")
+############################################################
+# Database errors
+############################################################
+@pytest.mark.parametrize("method,path,payload", [
+    ("post", "/policies", {"name": "ErrPolicy"}),
+    ("put", "/policies/{policy_id}", {"name": "NewName"}),
+    ("patch", "/policies/{policy_id}", {"name": "PatchedName"}),
+    ("delete", "/policies/{policy_id}", None),
+])
+def test_policy_db_error(client, session, broken_commit, method, path, payload):
+    policy = create_policy(session, name="DbErr")
+    broken_commit()
+    resp = getattr(client, method)(path.format(policy_id=policy.id), json=payload)
     assert resp.status_code == 500
     data = resp.get_json()
     assert "message" in data
@@ -21,10 +21,13 @@ Helper functions:
     - create_resource: Utility to insert a resource into the test database
 """
 
-import uuid
-from sqlalchemy.exc import SQLAlchemyError
+import pytest
 from app.models.resource import Resource
+from tests._util import NON_EXISTENT_ID, error_mentions
 
+# One character over the name (50) and description (255) limits
+NAME_TOO_LONG = "A" * 51
+DESCRIPTION_TOO_LONG = "D" * 256
 
 ############################################################
 # GET /resources
@@ -36,13 +39,19 @@ def create_resource(session, name="TestResource", description="desc"):
         description=description
     )
     session.add(resource)
-    session.commit()
+    session.flush()
     return resource
 
+def create_resources(session, names, description="desc"):
+    """Helper function to insert several resources with a single executemany."""
+    session.execute(Resource.__table__.insert(), [
+        {"name": name, "description": description} for name in names
+    ])
+    session.flush()
+
 def test_get_resources_success(client, session):
     """Should return 200 and a list of resources for a valid company_id."""
-    res1 = create_resource(session, name="Res1")
-    res2 = create_resource(session, name="Res2")
+    create_resources(session, ["Res1", "Res2"])
     resp = client.get("/resources")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -83,15 +92,19 @@ def test_post_resources_success(client, session):
     data = resp.get_json()
     assert data["name"] == "Resource1"
 
-def test_post_resources_missing_name(client):
-    """Should return 400 if name is missing."""
-    company_id = str(uuid.uuid4())
-    payload = {"description": "desc", "company_id": company_id}
-    resp = client.post("/resources", json=payload)
+@pytest.mark.parametrize("payload,field", [
+    ({"description": "desc"}, "name"),
+    ({"name": NAME_TOO_LONG, "description": "desc"}, "name"),
+    ({"name": "Resource1", "description": DESCRIPTION_TOO_LONG}, "description"),
+], ids=["missing_name", "name_too_long", "description_too_long"])
+def test_post_resources_invalid_data(client, company_id, payload, field):
+    """Should return 400 if name is missing or name/description is too long."""
+    resp = client.post("/resources", json={**payload, "company_id": company_id})
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "name" in str(data).lower() or "message" in data
+    assert error_mentions(data, field)
 
+@pytest.mark.usefixtures("db_reset")
 def test_post_resources_missing_company_id(client):
     """Should return 201 if company_id is missing (now optional)."""
     payload = {"name": "Resource1", "description": "desc"}
@@ -100,43 +113,14 @@ def test_post_resources_missing_company_id(client):
     data = resp.get_json()
     assert data["name"] == "Resource1"
 
-def test_post_resources_name_too_long(client):
-    """Should return 400 if name is too long."""
-    company_id = str(uuid.uuid4())
-    payload = {"name": "A"*51, "description": "desc", "company_id": company_id}
-    resp = client.post("/resources", json=payload)
-    assert resp.status_code == 400
-    data = resp.get_json()
-    assert "name" in str(data).lower() or "message" in data
-
-def test_post_resources_description_too_long(client):
-    """Should return 400 if description is too long."""
-    company_id = str(uuid.uuid4())
-    payload = {"name": "Resource1", "description": "D"*256, "company_id": company_id}
-    resp = client.post("/resources", json=payload)
-    assert resp.status_code == 400
-    data = resp.get_json()
-    assert "description" in str(data).lower() or "message" in data
-
 def test_post_resources_duplicate(client, session):
     """Should return 409 if resource with same name already exists for the company."""
-    client.post("/resources", json={"name": "Resource1", "description": "desc"})
+    create_resource(session, name="Resource1")
     resp = client.post("/resources", json={"name": "Resource1", "description": "desc"})
     assert resp.status_code == 409
     data = resp.get_json()
     assert "message" in data
 
-def test_post_resources_db_error(client, monkeypatch):
-    """Should return 500 if a database error occurs during resource creation."""
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("Mocked SQLAlchemyError")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    company_id = str(uuid.uuid4())
-    resp = client.post("/resources", json={"name": "Resource1", "description": "desc"})
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
-
 
 ############################################################
 # GET /resources/<resource_id>
@@ -152,11 +136,10 @@ def test_get_resource_by_id_success(client, session):
 
 def test_get_resource_by_id_not_found(client):
     """Should return 404 if the resource does not exist."""
-    non_existent_id = str(uuid.uuid4())
-    resp = client.get(f"/resources/{non_existent_id}")
+    resp = client.get(f"/resources/{NON_EXISTENT_ID}")
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
 def test_get_resource_by_id_invalid_format(client):
     """Should return 404 or 500 for an invalid resource_id format (not a UUID)."""
@@ -182,33 +165,20 @@ def test_put_resource_success(client, session):
 
 def test_put_resource_not_found(client):
     """Should return 404 if the resource does not exist."""
-    non_existent_id = str(uuid.uuid4())
     payload = {"name": "Name", "description": "desc"}
-    resp = client.put(f"/resources/{non_existent_id}", json=payload)
+    resp = client.put(f"/resources/{NON_EXISTENT_ID}", json=payload)
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
 def test_put_resource_invalid_data(client, session):
     """Should return 400 if the payload is invalid (e.g., name too long)."""
     resource = create_resource(session, name="Res1")
-    payload = {"name": "A"*51, "description": "desc"}
+    payload = {"name": NAME_TOO_LONG, "description": "desc"}
     resp = client.put(f"/resources/{resource.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "name" in str(data).lower() or "message" in data
-
-def test_put_resource_db_error(client, session, monkeypatch):
-    """Should return 500 if a database error occurs during update."""
-    resource = create_resource(session, name="Res1")
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("Mocked SQLAlchemyError")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"name": "Res1", "description": "desc"}
-    resp = client.put(f"/resources/{resource.id}", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    assert error_mentions(data, "name")
 
 
 ############################################################
@@ -227,33 +197,20 @@ def test_patch_resource_success(client, session):
 
 def test_patch_resource_not_found(client):
     """Should return 404 if the resource does not exist."""
-    non_existent_id = str(uuid.uuid4())
     payload = {"description": "patched desc"}
-    resp = client.patch(f"/resources/{non_existent_id}", json=payload)
+    resp = client.patch(f"/resources/{NON_EXISTENT_ID}", json=payload)
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
 
 def test_patch_resource_invalid_data(client, session):
     """Should return 400 if the payload is invalid (e.g., name too long)."""
     resource = create_resource(session, name="Res1")
-    payload = {"name": "A"*51}
+    payload = {"name": NAME_TOO_LONG}
     resp = client.patch(f"/resources/{resource.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "name" in str(data).lower() or "message" in data
-
-def test_patch_resource_db_error(client, session, monkeypatch):
-    """Should return 500 if a database error occurs during partial update."""
-    resource = create_resource(session, name="Res1")
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("Mocked SQLAlchemyError")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"description": "desc"}
-    resp = client.patch(f"/resources/{resource.id}", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    assert error_mentions(data, "name")
 
 
 ############################################################
@@ -264,26 +221,32 @@ def test_delete_resource_success(client, session):
     resource = create_resource(session, name="Res1")
     resp = client.delete(f"/resources/{resource.id}")
     assert resp.status_code == 204
-    # Optionally, check that the resource is actually deleted
-    get_resp = client.get(f"/resources/{resource.id}")
-    assert get_resp.status_code == 404
+    # The endpoint shares the test session: check the row directly
+    session.expire_all()
+    assert session.get(Resource, resource.id) is None
 
 def test_delete_resource_not_found(client):
     """Should return 404 if the resource does not exist."""
-    non_existent_id = str(uuid.uuid4())
-    resp = client.delete(f"/resources/{non_existent_id}")
+    resp = client.delete(f"/resources/{NON_EXISTENT_ID}")
     assert resp.status_code == 404
     data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
+    assert error_mentions(data, "not found")
+
 
-def test_delete_resource_db_error(client, session, monkeypatch):
-    """Should return 500 if a database error occurs during deletion."""
+############################################################
+# Database errors
+############################################################
+@pytest.mark.parametrize("method,path,payload", [
+    ("post", "/resources", {"name": "Resource1", "description": "desc"}),
+    ("put", "/resources/{resource_id}", {"name": "Res1", "description": "desc"}),
+    ("patch", "/resources/{resource_id}", {"description": "desc"}),
+    ("delete", "/resources/{resource_id}", None),
+])
+def test_resource_db_error(client, session, broken_commit, method, path, payload):
+    """Should return 500 if a database error occurs while writing."""
     resource = create_resource(session, name="Res1")
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("Mocked SQLAlchemyError")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    resp = client.delete(f"/resources/{resource.id}")
+    broken_commit()
+    resp = getattr(client, method)(path.format(resource_id=resource.id), json=payload)
     assert resp.status_code == 500
     data = resp.get_json()
     assert "message" in data
-
@@ -18,14 +18,33 @@ Test coverage includes:
 
 Fixtures:
     - client: Flask test client
-    - session: SQLAlchemy session for test DB
+    - session: SQLAlchemy session for test DB, only requested by tests that
+      seed rows (db_reset already isolates every test of the module)
 
 Helper functions:
     - create_user_role: Utility to insert a user-role assignment into the test database
+    - create_user_roles: Utility to insert several assignments with one executemany
+    - seeded_path: Utility to seed an assignment only for paths that need one
 """
 import uuid
+import pytest
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from app.models.db import db
 from app.models.user_role import UserRole
+from tests._util import NON_EXISTENT_ID, error_mentions
+
+pytestmark = pytest.mark.usefixtures("db_reset")
+
+# A valid assignment that matches none of the rows seeded by the tests
+ASSIGNMENT_PAYLOAD = {
+    "user_id": str(uuid.uuid4()),
+    "role_id": str(uuid.uuid4()),
+    "company_id": str(uuid.uuid4())
+}
+
+def raise_sqlalchemy_error(*_args, **_kwargs):
+    """Stand-in for a session method that fails with a database error."""
+    raise SQLAlchemyError("Mocked DB error")
 
 def create_user_role(session, user_id, role_id, company_id):
     """Helper function to create a user-role assignment in the database."""
@@ -36,9 +55,34 @@ def create_user_role(session, user_id, role_id, company_id):
         company_id=company_id
     )
     session.add(user_role)
-    session.commit()
+    session.flush()
     return user_role
 
+def seeded_path(session, path):
+    """Fill {user_role_id} in path with a freshly seeded assignment, if present.
+
+    POST cases of the validation tables need no existing row.
+    """
+    if "{user_role_id}" not in path:
+        return path
+    ur = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))
+    return path.format(user_role_id=ur.id)
+
+def create_user_roles(session, specs):
+    """Helper function to insert several user-role assignments with a single executemany.
+
+    specs is a list of (user_id, role_id, company_id) tuples. Returns the
+    ids of the new assignments, in the order of specs.
+    """
+    ids = [str(uuid.uuid4()) for _ in specs]
+    session.execute(UserRole.__table__.insert(), [
+        {"id": user_role_id, "user_id": user_id, "role_id": role_id,
+         "company_id": company_id}
+        for user_role_id, (user_id, role_id, company_id) in zip(ids, specs)
+    ])
+    session.flush()
+    return ids
+
 ############################################################
 # GET /user-roles
 ############################################################
@@ -46,17 +90,19 @@ def test_get_user_roles_success(client, session):
     user_id = str(uuid.uuid4())
     role_id = str(uuid.uuid4())
     company_id = str(uuid.uuid4())
-    ur1 = create_user_role(session, user_id, role_id, company_id)
-    ur2 = create_user_role(session, user_id, str(uuid.uuid4()), company_id)
+    ur1_id, ur2_id = create_user_roles(session, [
+        (user_id, role_id, company_id),
+        (user_id, str(uuid.uuid4()), company_id),
+    ])
     resp = client.get("/user-roles")
     assert resp.status_code == 200
     data = resp.get_json()
     assert isinstance(data, list)
     assert len(data) >= 2
     ids = [u["id"] for u in data]
-    assert ur1.id in ids and ur2.id in ids
+    assert ur1_id in ids and ur2_id in ids
 
-def test_get_user_roles_empty(client, session):
+def test_get_user_roles_empty(client):
     resp = client.get("/user-roles")
     assert resp.status_code == 200
     data = resp.get_json()
@@ -66,11 +112,7 @@ def test_get_user_roles_empty(client, session):
 # POST /user-roles
 ############################################################
 def test_post_user_roles_success(client):
-    payload = {
-        "user_id": str(uuid.uuid4()),
-        "role_id": str(uuid.uuid4()),
-        "company_id": str(uuid.uuid4())
-    }
+    payload = ASSIGNMENT_PAYLOAD
     resp = client.post("/user-roles", json=payload)
     assert resp.status_code == 201
     data = resp.get_json()
@@ -80,15 +122,12 @@ def test_post_user_roles_success(client):
     assert "id" in data
 
 def test_post_user_roles_missing_field(client):
-    payload = {
-        "user_id": str(uuid.uuid4()),
-        "role_id": str(uuid.uuid4())
-        # company_id missing
-    }
+    payload = {**ASSIGNMENT_PAYLOAD}
+    del payload["company_id"]
     resp = client.post("/user-roles", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "company_id" in str(data).lower() or "message" in data
+    assert error_mentions(data, "company_id")
 
 def test_post_user_roles_duplicate(client, session):
     user_id = str(uuid.uuid4())
@@ -101,20 +140,6 @@ def test_post_user_roles_duplicate(client, session):
     data = resp.get_json()
     assert "message" in data
 
-def test_post_user_roles_db_error(client, monkeypatch):
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {
-        "user_id": str(uuid.uuid4()),
-        "role_id": str(uuid.uuid4()),
-        "company_id": str(uuid.uuid4())
-    }
-    resp = client.post("/user-roles", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
-
 ############################################################
 # GET /user-roles/<user_role_id>
 ############################################################
@@ -131,18 +156,9 @@ def test_get_user_role_by_id_success(client, session):
     assert data["role_id"] == role_id
     assert data["company_id"] == company_id
 
-def test_get_user_role_by_id_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    resp = client.get(f"/user-roles/{non_existent_id}")
-    assert resp.status_code == 404
-    data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
-
 def test_get_user_role_by_id_db_error(client, session, monkeypatch):
     ur = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.get", raise_sqlalchemy_error)
+    monkeypatch.setattr(db.session, "get", raise_sqlalchemy_error)
     resp = client.get(f"/user-roles/{ur.id}")
     assert resp.status_code == 500
     data = resp.get_json()
@@ -165,14 +181,6 @@ def test_put_user_role_success(client, session):
     assert data["role_id"] == role_id
     assert data["company_id"] == company_id
 
-def test_put_user_role_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    payload = {"user_id": str(uuid.uuid4()), "role_id": str(uuid.uuid4()), "company_id": str(uuid.uuid4())}
-    resp = client.put(f"/user-roles/{non_existent_id}", json=payload)
-    assert resp.status_code == 404
-    data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
-
 def test_put_user_role_invalid_data(client, session):
     user_id = str(uuid.uuid4())
     role_id = str(uuid.uuid4())
@@ -182,21 +190,7 @@ def test_put_user_role_invalid_data(client, session):
     resp = client.put(f"/user-roles/{ur.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "user_id" in str(data).lower() or "message" in data
-
-def test_put_user_role_db_error(client, session, monkeypatch):
-    user_id = str(uuid.uuid4())
-    role_id = str(uuid.uuid4())
-    company_id = str(uuid.uuid4())
-    ur = create_user_role(session, user_id, role_id, company_id)
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"user_id": user_id, "role_id": role_id, "company_id": company_id}
-    resp = client.put(f"/user-roles/{ur.id}", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    assert error_mentions(data, "user_id")
 
 ############################################################
 # PATCH /user-roles/<user_role_id>
@@ -213,14 +207,6 @@ def test_patch_user_role_success(client, session):
     assert data["id"] == ur.id
     assert data["role_id"] == payload["role_id"]
 
-def test_patch_user_role_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    payload = {"role_id": str(uuid.uuid4())}
-    resp = client.patch(f"/user-roles/{non_existent_id}", json=payload)
-    assert resp.status_code == 404
-    data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
-
 def test_patch_user_role_invalid_data(client, session):
     user_id = str(uuid.uuid4())
     role_id = str(uuid.uuid4())
@@ -230,21 +216,8 @@ def test_patch_user_role_invalid_data(client, session):
     resp = client.patch(f"/user-roles/{ur.id}", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "user_id" in str(data).lower() or "message" in data
-
-def test_patch_user_role_db_error(client, session, monkeypatch):
-    user_id = str(uuid.uuid4())
-    role_id = str(uuid.uuid4())
-    company_id = str(uuid.uuid4())
-    ur = create_user_role(session, user_id, role_id, company_id)
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    payload = {"role_id": str(uuid.uuid4())}
-    resp = client.patch(f"/user-roles/{ur.id}", json=payload)
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    # Un payload sans aucune valeur renseignée est refusé avant validation
+    assert error_mentions(data, "user_id", "empty payload")
 
 ############################################################
 # DELETE /user-roles/<user_role_id>
@@ -256,148 +229,94 @@ def test_delete_user_role_success(client, session):
     ur = create_user_role(session, user_id, role_id, company_id)
     resp = client.delete(f"/user-roles/{ur.id}")
     assert resp.status_code == 204
-    # Optionally, check that the user-role is actually deleted
-    get_resp = client.get(f"/user-roles/{ur.id}")
-    assert get_resp.status_code == 404
-
-def test_delete_user_role_not_found(client):
-    non_existent_id = str(uuid.uuid4())
-    resp = client.delete(f"/user-roles/{non_existent_id}")
-    assert resp.status_code == 404
-    data = resp.get_json()
-    assert "not found" in str(data).lower() or "message" in data
-
-def test_delete_user_role_db_error(client, session, monkeypatch):
-    user_id = str(uuid.uuid4())
-    role_id = str(uuid.uuid4())
-    company_id = str(uuid.uuid4())
-    ur = create_user_role(session, user_id, role_id, company_id)
-    def raise_sqlalchemy_error(*args, **kwargs):
-        raise SQLAlchemyError("DB error")
-    monkeypatch.setattr("app.models.db.db.session.commit", raise_sqlalchemy_error)
-    resp = client.delete(f"/user-roles/{ur.id}")
-    assert resp.status_code == 500
-    data = resp.get_json()
-    assert "message" in data
+    # The endpoint shares the test session: check the row directly
+    session.expire_all()
+    assert session.get(UserRole, ur.id) is None
 
 ############################################################
 # ADVANCED/EDGE CASES
 ############################################################
-import pytest
-
-@pytest.mark.parametrize("endpoint,method", [
-    ("/user-roles/invalid-uuid", "get"),
-    ("/user-roles/invalid-uuid", "put"),
-    ("/user-roles/invalid-uuid", "patch"),
-    ("/user-roles/invalid-uuid", "delete"),
-])
-def test_invalid_uuid_format(client, endpoint, method):
-    """Should return 400 or 404 for invalid UUID format in endpoints."""
-    payload = {"user_id": str(uuid.uuid4()), "role_id": str(uuid.uuid4()), "company_id": str(uuid.uuid4())}
-    if method == "get":
-        resp = client.get(endpoint)
-    elif method == "put":
-        resp = client.put(endpoint, json=payload)
-    elif method == "patch":
-        resp = client.patch(endpoint, json={"role_id": str(uuid.uuid4())})
-    elif method == "delete":
-        resp = client.delete(endpoint)
-    else:
-        pytest.skip("Unknown method")
-        return  # Ensure resp is not used if skipped
-    assert resp.status_code in (400, 404)
-    data = resp.get_json()
-    assert "message" in data
-
-def test_post_user_roles_extra_fields(client):
-    """Should return 400 if extra/unexpected fields are provided."""
-    payload = {
-        "user_id": str(uuid.uuid4()),
-        "role_id": str(uuid.uuid4()),
-        "company_id": str(uuid.uuid4()),
-        "extra_field": "not allowed"
-    }
+def test_post_user_roles_whitespace_fields(client):
+    """Should return 400 if fields are whitespace-only strings."""
+    payload = {"user_id": "   ", "role_id": "\t", "company_id": "\n"}
     resp = client.post("/user-roles", json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "extra" in str(data).lower() or "message" in data
+    assert error_mentions(data, "user_id", "role_id", "company_id")
 
-def test_put_user_role_extra_fields(client, session):
-    """Should return 400 if extra/unexpected fields are provided on PUT."""
-    ur = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))
-    payload = {
-        "user_id": ur.user_id,
-        "role_id": ur.role_id,
-        "company_id": ur.company_id,
-        "extra_field": "not allowed"
-    }
-    resp = client.put(f"/user-roles/{ur.id}", json=payload)
-    assert resp.status_code == 400
+@pytest.mark.parametrize("method", ["put", "patch"])
+def test_user_role_duplicate_assignment(client, session, method):
+    """Should return 409 if PUT/PATCH would create a duplicate user-role assignment."""
+    user_id = str(uuid.uuid4())
+    role_id = str(uuid.uuid4())
+    company_id = str(uuid.uuid4())
+    _, ur2_id = create_user_roles(session, [
+        (user_id, role_id, company_id),
+        (str(uuid.uuid4()), str(uuid.uuid4()), company_id),
+    ])
+    payload = {"user_id": user_id, "role_id": role_id, "company_id": company_id}
+    resp = getattr(client, method)(f"/user-roles/{ur2_id}", json=payload)
+    assert resp.status_code == 409
     data = resp.get_json()
-    assert "extra" in str(data).lower() or "message" in data
+    assert error_mentions(data, "already exists")
 
-def test_patch_user_role_extra_fields(client, session):
-    """Should return 400 if extra/unexpected fields are provided on PATCH."""
-    ur = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))
-    payload = {"extra_field": "not allowed"}
-    resp = client.patch(f"/user-roles/{ur.id}", json=payload)
+@pytest.mark.parametrize("method,path,payload", [
+    ("post", "/user-roles", ASSIGNMENT_PAYLOAD),
+    ("put", "/user-roles/{user_role_id}", ASSIGNMENT_PAYLOAD),
+    ("patch", "/user-roles/{user_role_id}", {}),
+])
+def test_user_role_extra_fields(client, session, method, path, payload):
+    """Should return 400 if extra/unexpected fields are provided."""
+    path = seeded_path(session, path)
+    payload = {**payload, "extra_field": "not allowed"}
+    resp = getattr(client, method)(path, json=payload)
     assert resp.status_code == 400
     data = resp.get_json()
-    assert "extra" in str(data).lower() or "message" in data
+    assert error_mentions(data, "extra_field")
 
-def test_post_user_roles_empty_payload(client):
+@pytest.mark.parametrize("method,path", [
+    ("post", "/user-roles"),
+    ("put", "/user-roles/{user_role_id}"),
+    ("patch", "/user-roles/{user_role_id}"),
+])
+def test_user_role_empty_payload(client, session, method, path):
     """Should return 400 if payload is empty."""
-    resp = client.post("/user-roles", json={})
+    resp = getattr(client, method)(seeded_path(session, path), json={})
     assert resp.status_code == 400
     data = resp.get_json()
     assert "message" in data or "errors" in data
 
-def test_put_user_role_empty_payload(client, session):
-    """Should return 400 if payload is empty on PUT."""
-    ur = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))
-    resp = client.put(f"/user-roles/{ur.id}", json={})
-    assert resp.status_code == 400
+############################################################
+# Not found and invalid ids
+############################################################
+@pytest.mark.parametrize("user_role_id", [NON_EXISTENT_ID, "invalid-uuid"])
+@pytest.mark.parametrize("method,payload", [
+    ("get", None),
+    ("put", ASSIGNMENT_PAYLOAD),
+    ("patch", {"role_id": NON_EXISTENT_ID}),
+    ("delete", None),
+])
+def test_user_role_not_found(client, method, payload, user_role_id):
+    """Should return 404 for a missing or malformed user_role_id."""
+    resp = getattr(client, method)(f"/user-roles/{user_role_id}", json=payload)
+    assert resp.status_code == 404
     data = resp.get_json()
-    assert "message" in data or "errors" in data
+    assert error_mentions(data, "not found")
 
-def test_patch_user_role_empty_payload(client, session):
-    """Should return 400 if payload is empty on PATCH."""
+############################################################
+# Database errors
+############################################################
+@pytest.mark.parametrize("method,path,payload", [
+    ("post", "/user-roles", ASSIGNMENT_PAYLOAD),
+    ("put", "/user-roles/{user_role_id}", ASSIGNMENT_PAYLOAD),
+    ("patch", "/user-roles/{user_role_id}", {"role_id": NON_EXISTENT_ID}),
+    ("delete", "/user-roles/{user_role_id}", None),
+])
+def test_user_role_db_error(client, session, broken_commit, method, path, payload):
+    """Should return 500 if a database error occurs while writing."""
     ur = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4()))
-    resp = client.patch(f"/user-roles/{ur.id}", json={})
-    assert resp.status_code == 400
-    data = resp.get_json()
-    assert "message" in data or "errors" in data
-
-def test_post_user_roles_whitespace_fields(client):
-    """Should return 400 if fields are whitespace-only strings."""
-    payload = {"user_id": "   ", "role_id": "\t", "company_id": "\n"}
-    resp = client.post("/user-roles", json=payload)
-    assert resp.status_code == 400
-    data = resp.get_json()
-    assert "user_id" in str(data).lower() or "role_id" in str(data).lower() or "company_id" in str(data).lower() or "message" in data
-
-def test_put_user_role_duplicate_assignment(client, session):
-    """Should return 409 if PUT would create a duplicate user-role assignment."""
-    user_id = str(uuid.uuid4())
-    role_id = str(uuid.uuid4())
-    company_id = str(uuid.uuid4())
-    ur1 = create_user_role(session, user_id, role_id, company_id)
-    ur2 = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), company_id)
-    payload = {"user_id": user_id, "role_id": role_id, "company_id": company_id}
-    resp = client.put(f"/user-roles/{ur2.id}", json=payload)
-    assert resp.status_code == 409
-    data = resp.get_json()
-    assert "already exists" in str(data).lower() or "message" in data
-
-def test_patch_user_role_duplicate_assignment(client, session):
-    """Should return 409 if PATCH would create a duplicate user-role assignment."""
-    user_id = str(uuid.uuid4())
-    role_id = str(uuid.uuid4())
-    company_id = str(uuid.uuid4())
-    ur1 = create_user_role(session, user_id, role_id, company_id)
-    ur2 = create_user_role(session, str(uuid.uuid4()), str(uuid.uuid4()), company_id)
-    payload = {"user_id": user_id, "role_id": role_id, "company_id": company_id}
-    resp = client.patch(f"/user-roles/{ur2.id}", json=payload)
-    assert resp.status_code == 409
+    broken_commit()
+    resp = getattr(client, method)(path.format(user_role_id=ur.id), json=payload)
+    assert resp.status_code == 500
     data = resp.get_json()
-    assert "already exists" in str(data).lower() or "message" in data
\ No newline at end of file
+    assert "message" in data
@@ -0,0 +1,146 @@
+"""
+test_utils.py
+-------------
+Tests for the check_access helper used by the access control decorator.
+"""
+import uuid
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from app.models import (
+    Resource, Role, Policy, RolePolicy, PolicyPermission, Permission,
+    UserRole, OperationEnum
+)
+from app.utils import check_access, check_access_required
+
+pytestmark = pytest.mark.usefixtures("db_reset")
+
+
+def grant_permission(session, user_id, resource_name, *operations):
+    """Create resource_name and grant operations on it to user_id.
+
+    The resource -> permission -> policy -> role -> user graph is grouped
+    by table and inserted with one Core executemany INSERT per table, in
+    dependency order, then flushed into the db_reset transaction.
+    """
+    resource_id, policy_id, role_id = (str(uuid.uuid4()) for _ in range(3))
+    permission_ids = [str(uuid.uuid4()) for _ in operations]
+    rows = {
+        Resource: [{"id": resource_id, "name": resource_name}],
+        Permission: [
+            {
+                "id": permission_id, "resource_id": resource_id,
+                "operation": OperationEnum(operation)
+            }
+            for permission_id, operation in zip(permission_ids, operations)
+        ],
+        Policy: [{"id": policy_id, "name": "test_policy"}],
+        PolicyPermission: [
+            {
+                "id": str(uuid.uuid4()), "policy_id": policy_id,
+                "permission_id": permission_id
+            }
+            for permission_id in permission_ids
+        ],
+        Role: [{"id": role_id, "name": "test_role"}],
+        RolePolicy: [
+            {"id": str(uuid.uuid4()), "role_id": role_id, "policy_id": policy_id}
+        ],
+        UserRole: [
+            {"id": str(uuid.uuid4()), "user_id": user_id, "role_id": role_id}
+        ],
+    }
+    for model, table_rows in rows.items():
+        session.execute(model.__table__.insert(), table_rows)
+    session.flush()
+
+
+def test_check_access_granted(session):
+    """A user whose role grants the operation is allowed."""
+    user_id = str(uuid.uuid4())
+    grant_permission(session, user_id, "test_resource", "read", "update")
+    granted, _, status = check_access(user_id, "test_resource", OperationEnum.READ)
+    assert granted is True
+    assert status == 200
+
+
+def test_check_access_no_matching_permission(session):
+    """A user without the requested operation is denied with 403."""
+    user_id = str(uuid.uuid4())
+    grant_permission(session, user_id, "test_resource", "read")
+    granted, _, status = check_access(
+        user_id, "test_resource", OperationEnum.DELETE
+    )
+    assert granted is False
+    assert status == 403
+
+
+def test_check_access_user_without_roles(session, resource):
+    """A user with no role is denied with 403."""
+    res = resource()
+    granted, _, status = check_access(str(uuid.uuid4()), res.name, OperationEnum.READ)
+    assert granted is False
+    assert status == 403
+
+
+def test_check_access_resource_not_found(session):
+    """An unknown resource name yields 404."""
+    granted, _, status = check_access(str(uuid.uuid4()), "missing", OperationEnum.READ)
+    assert granted is False
+    assert status == 404
+
+
+def test_check_access_required_invalid_operation():
+    """An unknown operation name is rejected when building the decorator."""
+    with pytest.raises(ValueError):
+        check_access_required('bogus')
+
+
+def test_check_access_required_memoized_per_request(app, monkeypatch):
+    """The access decision is computed once per request and resource."""
+    calls = []
+
+    def fake_check_access(user_id, resource_name, operation):
+        calls.append((user_id, resource_name, operation))
+        return True, "granted", 200
+
+    monkeypatch.setattr("app.utils.check_access", fake_check_access)
+    view = check_access_required('read')(lambda resource_name: "ok")
+    with app.test_request_context(headers={"X-User-Id": "user"}):
+        assert view(resource_name="config") == "ok"
+        assert view(resource_name="config") == "ok"
+    with app.test_request_context(headers={"X-User-Id": "user"}):
+        assert view(resource_name="config") == "ok"
+    assert calls == [("user", "config", OperationEnum.READ)] * 2
+
+
+def test_check_access_required_fixed_resource_name(app, monkeypatch):
+    """A resource_name given to the decorator is used for the check."""
+    calls = []
+
+    def fake_check_access(user_id, resource_name, operation):
+        calls.append((user_id, resource_name, operation))
+        return True, "granted", 200
+
+    monkeypatch.setattr("app.utils.check_access", fake_check_access)
+    view = check_access_required('read', resource_name='config')(lambda: "ok")
+    with app.test_request_context(headers={"X-User-Id": "user"}):
+        assert view() == "ok"
+    assert calls == [("user", "config", OperationEnum.READ)]
+
+
+def test_check_access_database_error(session, resource, monkeypatch):
+    """A database error rolls the session back and yields 500."""
+    res = resource()
+    rollbacks = []
+
+    def failing_execute(*_args, **_kwargs):
+        raise SQLAlchemyError("boom")
+
+    monkeypatch.setattr(session, "execute", failing_execute)
+    monkeypatch.setattr(session, "rollback", lambda: rollbacks.append(True))
+    granted, _, status = check_access(
+        str(uuid.uuid4()), res.name, OperationEnum.READ
+    )
+    assert granted is False
+    assert status == 500
+    assert rollbacks == [True]
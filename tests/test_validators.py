@@ -0,0 +1,65 @@
+"""
+test_validators.py
+------------------
+Tests for the shared field validators of app.schemas.validators.
+"""
+import uuid
+import pytest
+from marshmallow import ValidationError
+from app.schemas.validators import is_uuid_string, max_length
+from app.schemas.role_policy_schema import RolePolicySchema
+
+CANONICAL = "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.mark.parametrize("value", [
+    CANONICAL,
+    CANONICAL.upper(),
+    "123E4567-e89b-12D3-A456-426614174000",
+    "00000000-0000-4000-8000-000000000000",
+])
+def test_is_uuid_string_accepts_canonical_form(value):
+    """Dashed 8-4-4-4-12 hex strings are accepted in any letter case."""
+    assert is_uuid_string(value) is True
+
+
+@pytest.mark.parametrize("value", [
+    CANONICAL.replace("-", ""),
+    "{" + CANONICAL + "}",
+    "urn:uuid:" + CANONICAL,
+    "123e4567e-89b-12d3-a456-426614174000",
+    "123e4567-e89b-12d3-a456-42661417400g",
+    "+23e4567-e89b-12d3-a456-426614174000",
+    "123e4567-e89b-12d3-a456-4266_4174000",
+    "123e4567-e89b-12d3-a456-42661417400١",
+    "123e4567-e89b-12d3-a456-42661417400０",
+    "",
+])
+def test_is_uuid_string_rejects_other_forms(value):
+    """Undashed, braced, URN, sign, underscore and non-ASCII forms fail."""
+    assert is_uuid_string(value) is False
+
+
+@pytest.mark.parametrize("value", [
+    None, 0x123e4567e89b12d3a456426614174000, uuid.UUID(CANONICAL),
+    CANONICAL.encode(), [CANONICAL],
+])
+def test_is_uuid_string_rejects_non_str(value):
+    """Only str values can be UUID strings."""
+    assert is_uuid_string(value) is False
+
+
+def test_role_policy_schema_rejects_non_canonical_uuid():
+    """Schema id validators reject UUIDs that are not in canonical form."""
+    schema = RolePolicySchema()
+    with pytest.raises(ValidationError):
+        schema.validate_role_id("{" + CANONICAL + "}")
+    schema.validate_role_id(CANONICAL)
+
+
+def test_max_length():
+    """Strings up to the limit pass and longer strings are rejected."""
+    validate = max_length(3)
+    validate("abc")
+    with pytest.raises(ValidationError, match="Longer than maximum length 3."):
+        validate("abcd")